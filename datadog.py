@@ -1,12 +1,90 @@
 import json
+import math
 import os
-from typing import Dict, Any
+import sys
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    orjson = None
 
 
 DATA_FILE = "budget_data.json"
+IO_BUFFER_SIZE = 1 << 20
+SEP = "-" * 70
+HEADER = f"{'Category':<20} {'Spent':<10} {'Limit':<10} {'Remaining':<10}"
+ROW_FMT = "{0:<20} ${1:<10.2f} ${2:<10.2f} ${3:<10.2f}".format
+MENU = (
+    "Choose an option:\n"
+    "1. Add a new category\n"
+    "2. Remove a category\n"
+    "3. Add an expense\n"
+    "4. Show summary\n"
+    "5. Save & Exit"
+)
+
+
+def _ask(prompt: str) -> str:
+    """
+    Prompts the user and reads one line from stdin, without going through readline.
+
+    Args:
+        prompt: Text written before reading.
+
+    Returns:
+        The entered line with surrounding whitespace stripped.
+
+    Raises:
+        EOFError: If stdin is exhausted, matching input().
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.strip()
+
+
+def _norm(s: str) -> str:
+    """
+    Normalizes a category name into the form used as a dictionary key.
+    """
+    return s.strip().lower()
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Serializes an object to JSON bytes, using orjson when available.
+
+    orjson writes inf and nan as null, and null never appears in budget
+    data, so its output is only used when it contains no null.
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj)
+        if b"null" not in data:
+            return data
+    return json.dumps(obj).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """
+    Parses JSON bytes, using orjson when available.
+
+    Files holding Infinity or NaN, which orjson rejects, are parsed by the
+    stdlib codec instead.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
 
 
 class BudgetCategory:
+    __slots__ = ("name", "limit", "spent")
+
     def __init__(self, name: str, limit: float) -> None:
         """
         Initializes a new budget category.
@@ -43,23 +121,37 @@ class BudgetCategory:
         print(f"💰 Set budget limit for '{self.name}' to ${self.limit:.2f} based on {percentage}% of ${income:.2f} income.")"""
 
 
-    def add_expense(self, amount: float) -> None:
+    def _apply_expense(self, amount: float) -> None:
+        """
+        Adds an expense to the category without any prompting.
+
+        Args:
+            amount: The amount to add to the category's spending.
+        """
+        self.spent += amount
+
+    def add_expense(self, amount: float) -> bool:
         """
-        Adds an expense to the category.
+        Adds an expense to the category, asking for confirmation if it exceeds the limit.
 
         Args:
             amount: The amount to add to the category's spending.
+
+        Returns:
+            True if the expense was added, False if the user declined it.
         """
         if self.spent + amount > self.limit:
             print(f"⚠️ Warning: Adding ${amount} exceeds the budget limit for '{self.name}'. Would you still like to proceed?")
-            proceed = input("Type 'yes' to proceed or 'no' to cancel: ").strip().lower()
+            proceed = _ask("Type 'yes' to proceed or 'no' to cancel: ").lower()
             if proceed == 'yes':
-                self.spent += amount
+                self._apply_expense(amount)
+                return True
             elif proceed == 'no':
                 print("🚫 Expense not added.")
-                return
+            return False
         else:
-            self.spent += amount
+            self._apply_expense(amount)
+            return True
 
     def remaining(self) -> float:
         """
@@ -73,60 +165,55 @@ class BudgetCategory:
 
         return self.limit - self.spent
 
-    def to_dict(self) -> Dict[str, Any]:
-        """
-        Converts the category data into a dictionary for saving.
 
-        Returns:
-            Dictionary containing name, limit, and spent values.
+class BudgetManager:
+    def __init__(self) -> None:
         """
-        return {
-            "name": self.name,
-            "limit": self.limit,
-            "spent": self.spent
-        }
-
-    @staticmethod
-    def from_dict(data: Dict[str, Any]) -> "BudgetCategory":
+        Initializes the BudgetManager. Data is loaded from disk on first use.
         """
-        Creates a BudgetCategory from a dictionary.
+        self._categories: Dict[str, BudgetCategory] = {}
+        self._loaded: bool = False
+        self._modified: bool = False
 
-        Args:
-            data: A dictionary with keys 'name', 'limit', and 'spent'.
-
-        Returns:
-            A populated BudgetCategory instance.
+    @property
+    def categories(self) -> Dict[str, BudgetCategory]:
         """
-        category = BudgetCategory(data["name"], data["limit"])
-        category.spent = data["spent"]
-        return category
+        The budget categories, keyed by name. Loads them from disk on first access.
+        """
+        self._ensure_loaded()
+        return self._categories
 
+    @categories.setter
+    def categories(self, value: Dict[str, BudgetCategory]) -> None:
+        self._categories = value
+        self._loaded = True
+        self._modified = True
 
-class BudgetManager:
-    def __init__(self) -> None:
+    def _ensure_loaded(self) -> None:
         """
-        Initializes the BudgetManager and loads data from disk.
+        Loads data from disk if it has not been loaded yet.
         """
-        self.categories: Dict[str, BudgetCategory] = {}
-        self.load_data()
+        if not self._loaded:
+            self.load_data()
 
     def add_category(self, name: str, limit: float) -> None:
         """
         Adds a new category to the budget.
 
         Args:
-            name: Name of the category.
+            name: Normalized name of the category (see _norm).
             limit: Budget limit for the category.
         """
-        # check if category already exists or if capitalized version exists
-        name = name.strip().lower()
-        if name in self.categories or name == "":
+        # check if category already exists; name is already normalized
+        name = sys.intern(name)
+        categories = self.categories
+        if not name or name in categories:
             print(f"🐶 Category '{name}' already exists!")
         else:
-            help = input(f"Would you like help setting a budget limit for '{name}'? Type 'yes' to proceed or 'no' if you have a set value in mind: ").strip().lower()
+            help = _ask(f"Would you like help setting a budget limit for '{name}'? Type 'yes' to proceed or 'no' if you have a set value in mind: ").lower()
             if help == 'yes':
-                income = input("What is your total income? ").strip()
-                percent = input(f"What percentage of your total income would you like to allocate towards '{name}'? (ex. 20 for 20%) ").strip()
+                income = _ask("What is your total income? ")
+                percent = _ask(f"What percentage of your total income would you like to allocate towards '{name}'? (ex. 20 for 20%) ")
                 try:
                     percentage = float(percent)
                     if percentage < 0 or percentage > 100:
@@ -142,14 +229,16 @@ class BudgetManager:
                     print("Invalid income. Please enter a valid number.")
                     return
                 limit = income * (percentage / 100)
-                self.categories[name] = BudgetCategory(name, limit)
+                categories[name] = BudgetCategory(name, limit)
+                self._modified = True
                 print(f"📊 Added new category: {name} with limit ${limit}")
             else:
                 if limit < 0:
                     print("⚠️ Budget limit cannot be negative. Please enter a valid limit.")
                     return
                 else:
-                    self.categories[name] = BudgetCategory(name, limit)
+                    categories[name] = BudgetCategory(name, limit)
+                    self._modified = True
                     print(f"📊 Added new category: {name} with limit ${limit}")
 
     def add_expense(self, name: str, amount: float) -> None:
@@ -157,30 +246,56 @@ class BudgetManager:
         Adds an expense to an existing category.
 
         Args:
-            name: Category name.
+            name: Normalized category name.
             amount: Expense amount to add.
         """
-        if name in self.categories:
-            self.categories[name].add_expense(amount)
-            print(f"💸 Added expense of ${amount} to '{name}'")
+        category = self.categories.get(name)
+        if category is not None:
+            if category.add_expense(amount):
+                self._modified = True
+                print(f"💸 Added expense of ${amount} to '{name}'")
         else:
             print(f"🚫 No such category: {name}")
+
+    def add_expenses_bulk(self, items: Iterable[Tuple[str, float]]) -> None:
+        """
+        Adds many expenses without prompting, then saves once.
+
+        Over-limit expenses are applied without confirmation. Expenses for
+        unknown categories are skipped.
+
+        Args:
+            items: (normalized category name, amount) pairs.
+        """
+        totals: Dict[str, float] = {}
+        for name, amount in items:
+            totals[name] = totals.get(name, 0.0) + amount
+        categories = self.categories
+        for name, amount in totals.items():
+            category = categories.get(name)
+            if category is None:
+                print(f"🚫 No such category: {name}")
+                continue
+            category._apply_expense(amount)
+            self._modified = True
+        self.save_data()
     
     def remove_category(self, name: str) -> None:
         """
         Removes a category from the budget.
 
         Args:
-            name: Name of the category to remove.
+            name: Normalized name of the category to remove.
         """
 
         if name in self.categories:
-            confirmation = input(f"Are you sure you want to remove the category '{name}?' Type 'yes' to confirm: ").strip().lower()
+            confirmation = _ask(f"Are you sure you want to remove the category '{name}?' Type 'yes' to confirm: ").lower()
             if confirmation != 'yes':
                 print("🚫 Category removal cancelled.")
                 return
             else:
                 del self.categories[name]
+                self._modified = True
                 print(f"🗑️ Removed category: {name}")
         else:
             print(f"🚫 No such category: {name}")
@@ -193,33 +308,130 @@ class BudgetManager:
         """
         Displays a summary of all budget categorie and their spending in table format.
         """
-        print("\n🐾 Budget Summary (Table View)"
-              "\n" + "-" * 70)
-        print(f"{'Category':<20} {'Spent':<10} {'Limit':<10} {'Remaining':<10}")    
-        print("-" * 70)
-        for category in self.categories.values():
-            remaining = category.remaining()
-            print(f"{category.name:<20} ${category.spent:<10.2f} ${category.limit:<10.2f} ${remaining:<10.2f}")
-            print("-" * 70)
-            total_spent = sum(cat.spent for cat in self.categories.values())
-        print(f"Total Spent: ${total_spent:.2f}")
+        cats = list(self.categories.values())
+        total_spent = math.fsum([c.spent for c in cats])
+        lines = ["\n🐾 Budget Summary (Table View)", SEP, HEADER, SEP]
+        for c in cats:
+            remaining = c.limit - c.spent
+            if remaining < 0:
+                lines.append(f"⚠️ Warning: You have exceeded the budget for '{c.name}'!")
+            lines.append(ROW_FMT(c.name, c.spent, c.limit, remaining))
+        lines.append(SEP)
+        lines.append(f"Total Spent: ${total_spent:.2f}")
+        sys.stdout.write("\n".join(lines) + "\n")
         
 
     def save_data(self) -> None:
         """
         Saves all budget data to a JSON file.
+
+        The data is written to a temporary file and renamed over DATA_FILE,
+        so an interrupted save never leaves a truncated file behind. If nothing
+        changed since the data was loaded or last saved, the write is skipped.
+        Only changes made through the manager's methods, or by assigning
+        categories, are tracked; edits made directly on the categories dict
+        or its BudgetCategory objects are not.
         """
-        with open(DATA_FILE, "w") as f:
-            json.dump({k: v.to_dict() for k, v in self.categories.items()}, f)
+        if not self._modified:
+            return
+        payload = _dumps({k: [c.limit, c.spent] for k, c in self.categories.items()})
+        tmp = DATA_FILE + ".tmp"
+        with open(tmp, "wb", buffering=IO_BUFFER_SIZE) as f:
+            f.write(payload)
+        os.replace(tmp, DATA_FILE)
+        self._modified = False
 
     def load_data(self) -> None:
         """
         Loads budget data from a JSON file if it exists.
+
+        Categories are stored as {name: [limit, spent]}; files written in the
+        older {name: {"name", "limit", "spent"}} layout are still accepted.
+        Errors reading or parsing the file propagate and leave the data
+        unloaded, so a later save cannot overwrite the file.
         """
-        if os.path.exists(DATA_FILE):
-            with open(DATA_FILE, "r") as f:
-                data = json.load(f)
-                self.categories = {k: BudgetCategory.from_dict(v) for k, v in data.items()}
+        try:
+            with open(DATA_FILE, "rb", buffering=IO_BUFFER_SIZE) as f:
+                data = _loads(f.read())
+        except FileNotFoundError:
+            self._loaded = True
+            return
+        categories: Dict[str, BudgetCategory] = {}
+        new = BudgetCategory.__new__
+        for k, v in data.items():
+            if isinstance(v, dict):  # legacy {"name", "limit", "spent"} entries
+                v = (v["limit"], v["spent"])
+            limit, spent = v
+            name = sys.intern(_norm(k))
+            category = new(BudgetCategory)
+            category.name = name
+            category.limit = limit
+            category.spent = spent
+            categories[name] = category
+        self._categories = categories
+        self._loaded = True
+
+
+def _cmd_add(manager: BudgetManager) -> None:
+    """
+    Prompts for a new category and its limit, then adds it.
+    """
+    name = _norm(_ask("Enter category name (e.g., dog treats): "))
+    try:
+        limit = float(_ask(f"Enter budget limit for '{name}': "))
+    except ValueError:
+        print("⚠️ Please enter a valid number.")
+        return
+    manager.add_category(name, limit)
+
+
+def _cmd_remove(manager: BudgetManager) -> None:
+    """
+    Prompts for a category name and removes it.
+    """
+    name = _norm(_ask("Enter category name to remove: "))
+    manager.remove_category(name)
+
+
+def _cmd_expense(manager: BudgetManager) -> None:
+    """
+    Prompts for a category name and amount, then records the expense.
+    """
+    name = _norm(_ask("Enter category name: "))
+    try:
+        amount = float(_ask("Enter expense amount: "))
+    except ValueError:
+        print("⚠️ Please enter a valid number.")
+        return
+    manager.add_expense(name, amount)
+
+
+def _cmd_summary(manager: BudgetManager) -> None:
+    """
+    Shows the budget summary table.
+    """
+    manager.show_summary()
+
+
+def _cmd_save_exit(manager: BudgetManager) -> bool:
+    """
+    Saves the budget and signals the main loop to exit.
+
+    Returns:
+        False, telling the main loop to stop.
+    """
+    manager.save_data()
+    print("✅ Budget saved. Keep your tail wagging!")
+    return False
+
+
+DISPATCH: Dict[str, Callable[[BudgetManager], Optional[bool]]] = {
+    "1": _cmd_add,
+    "2": _cmd_remove,
+    "3": _cmd_expense,
+    "4": _cmd_summary,
+    "5": _cmd_save_exit,
+}
 
 
 def main() -> None:
@@ -230,40 +442,16 @@ def main() -> None:
     manager = BudgetManager()
 
     while True:
-        print("Choose an option:")
-        print("1. Add a new category")
-        print("2. Remove a category")
-        print("3. Add an expense")
-        print("4. Show summary")
-        print("5. Save & Exit")
-
-        choice: str = input("Enter choice (1-5): ").strip()
-
-        if choice == "1":
-            name = input("Enter category name (e.g., dog treats): ").strip()
-            try:
-                limit = float(input(f"Enter budget limit for '{name}': "))
-                manager.add_category(name, limit)
-            except ValueError:
-                print("⚠️ Please enter a valid number.")
-        elif choice == "2":
-            name = input("Enter category name to remove: ").strip()
-            manager.remove_category(name)
-        elif choice == "3":
-            name = input("Enter category name: ").strip()
-            try:
-                amount = float(input("Enter expense amount: "))
-                manager.add_expense(name, amount)
-            except ValueError:
-                print("⚠️ Please enter a valid number.")
-        elif choice == "4":
-            manager.show_summary()
-        elif choice == "5":
-            manager.save_data()
-            print("✅ Budget saved. Keep your tail wagging!")
-            break
-        else:
+        print(MENU)
+
+        choice: str = _ask("Enter choice (1-5): ")
+
+        command = DISPATCH.get(choice)
+        if command is None:
             print("❓ Invalid choice. Please try again.")
+            continue
+        if command(manager) is False:
+            break
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,229 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import datadog
+
+
+class BudgetTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.tmpdir = tmpdir.name
+        patcher = mock.patch.object(datadog, "DATA_FILE", os.path.join(self.tmpdir, "budget_data.json"))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_io(self, func, *args, stdin: str = "") -> str:
+        """
+        Calls func with the given stdin text and returns everything it printed.
+        """
+        out = io.StringIO()
+        with mock.patch("sys.stdin", io.StringIO(stdin)), contextlib.redirect_stdout(out):
+            func(*args)
+        return out.getvalue()
+
+
+class SummaryTest(BudgetTestCase):
+    def test_empty_summary(self) -> None:
+        output = self.run_io(datadog.BudgetManager().show_summary)
+        self.assertIn("Total Spent: $0.00", output)
+
+    def test_summary_rows_and_warning(self) -> None:
+        manager = datadog.BudgetManager()
+        manager.categories["toys"] = datadog.BudgetCategory("toys", 5.0)
+        manager.categories["toys"].spent = 7.0
+        manager.categories["treats"] = datadog.BudgetCategory("treats", 5.0)
+        manager.categories["treats"].spent = 1.5
+
+        lines = self.run_io(manager.show_summary).splitlines()
+        self.assertEqual(lines.count("-" * 70), 3)
+        self.assertEqual(lines.count("⚠️ Warning: You have exceeded the budget for 'toys'!"), 1)
+        self.assertEqual(lines[-1], "Total Spent: $8.50")
+
+    def test_summary_is_a_single_write(self) -> None:
+        manager = datadog.BudgetManager()
+        for name in ("a", "b", "c"):
+            manager.categories[name] = datadog.BudgetCategory(name, 1.0)
+
+        writes = []
+        stream = io.StringIO()
+        stream.write = writes.append
+        with contextlib.redirect_stdout(stream):
+            manager.show_summary()
+        self.assertEqual(len(writes), 1)
+
+    def test_row_format(self) -> None:
+        manager = datadog.BudgetManager()
+        manager.categories["toys"] = datadog.BudgetCategory("toys", 5.0)
+        manager.categories["toys"].spent = 7.0
+
+        lines = self.run_io(manager.show_summary).splitlines()
+        self.assertIn(f"{'toys':<20} ${7.0:<10.2f} ${5.0:<10.2f} ${-2.0:<10.2f}", lines)
+
+
+class SaveDataTest(BudgetTestCase):
+    def test_save_leaves_no_temp_file(self) -> None:
+        manager = datadog.BudgetManager()
+        self.run_io(manager.add_category, "food", 10.0, stdin="no\n")
+        manager.save_data()
+
+        self.assertEqual(os.listdir(self.tmpdir), ["budget_data.json"])
+        with open(datadog.DATA_FILE) as f:
+            self.assertEqual(list(json.load(f)), ["food"])
+
+
+class MainTest(BudgetTestCase):
+    def test_dispatch_covers_menu(self) -> None:
+        self.assertEqual(sorted(datadog.DISPATCH), ["1", "2", "3", "4", "5"])
+
+    def test_invalid_choice_then_exit(self) -> None:
+        output = self.run_io(datadog.main, stdin="9\n5\n")
+        self.assertIn("❓ Invalid choice. Please try again.", output)
+        self.assertTrue(output.endswith("✅ Budget saved. Keep your tail wagging!\n"))
+
+
+class AskTest(BudgetTestCase):
+    def test_ask_strips_line(self) -> None:
+        with mock.patch("sys.stdin", io.StringIO("  Dog Treats \n")), contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(datadog._ask("> "), "Dog Treats")
+
+    def test_ask_raises_on_drained_input(self) -> None:
+        with mock.patch("sys.stdin", io.StringIO("")), contextlib.redirect_stdout(io.StringIO()):
+            with self.assertRaises(EOFError):
+                datadog._ask("> ")
+
+    def test_main_stops_on_drained_input(self) -> None:
+        with self.assertRaises(EOFError):
+            self.run_io(datadog.main, stdin="4\n")
+
+
+class BulkExpenseTest(BudgetTestCase):
+    def test_bulk_skips_unknown_and_saves_once(self) -> None:
+        manager = datadog.BudgetManager()
+        manager.categories["food"] = datadog.BudgetCategory("food", 4.0)
+        with mock.patch.object(manager, "save_data") as save_data:
+            output = self.run_io(manager.add_expenses_bulk, [("food", 2.0), ("toys", 1.0), ("food", 3.0)])
+
+        save_data.assert_called_once_with()
+        self.assertEqual(manager.categories["food"].spent, 5.0)
+        self.assertIn("🚫 No such category: toys", output)
+
+
+class SaveLoadTest(BudgetTestCase):
+    def write(self, data) -> None:
+        with open(datadog.DATA_FILE, "w") as f:
+            json.dump(data, f)
+
+    def read(self):
+        with open(datadog.DATA_FILE) as f:
+            return json.load(f)
+
+    def test_round_trip_new_format(self) -> None:
+        self.write({"dog toys": [5.0, 1.5], "dog treats": [10.0, 0.0]})
+        manager = datadog.BudgetManager()
+        manager.add_expenses_bulk([("dog treats", 2.0)])
+        self.assertEqual(self.read(), {"dog toys": [5.0, 1.5], "dog treats": [10.0, 2.0]})
+
+        category = datadog.BudgetManager().categories["dog treats"]
+        self.assertEqual((category.name, category.limit, category.spent), ("dog treats", 10.0, 2.0))
+
+    def test_round_trip_legacy_format(self) -> None:
+        self.write({
+            "Dog Toys": {"name": "Dog Toys", "limit": 5.0, "spent": 1.5},
+            "dog treats": {"name": "dog treats", "limit": 10.0, "spent": 0.0},
+        })
+        manager = datadog.BudgetManager()
+        manager.add_expenses_bulk([("dog toys", 1.0)])
+        self.assertEqual(self.read(), {"dog toys": [5.0, 2.5], "dog treats": [10.0, 0.0]})
+
+    def test_save_reflects_direct_changes_and_reloads(self) -> None:
+        self.write({"a": [1.0, 0.0], "b": [2.0, 0.0], "c": [3.0, 0.0]})
+        manager = datadog.BudgetManager()
+        manager.add_expenses_bulk([("a", 0.5)])
+
+        del manager.categories["b"]
+        manager.categories["a"].limit = 4.0
+        manager.add_expenses_bulk([("c", 1.0)])
+        self.assertEqual(self.read(), {"a": [4.0, 0.5], "c": [3.0, 1.0]})
+
+        self.write({"x": [1.0, 0.0]})
+        manager.load_data()
+        manager.add_expenses_bulk([("x", 1.0)])
+        self.assertEqual(self.read(), {"x": [1.0, 1.0]})
+
+    def test_corrupt_file_is_not_overwritten(self) -> None:
+        with open(datadog.DATA_FILE, "w") as f:
+            f.write('{"a":')
+        manager = datadog.BudgetManager()
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                manager.categories
+        with open(datadog.DATA_FILE) as f:
+            self.assertEqual(f.read(), '{"a":')
+
+
+@unittest.skipIf(datadog.orjson is None, "orjson is not installed")
+class NonFiniteTest(BudgetTestCase):
+    def test_infinite_limit_round_trips_with_orjson(self) -> None:
+        manager = datadog.BudgetManager()
+        manager.categories["fun"] = datadog.BudgetCategory("fun", float("inf"))
+        manager.add_expenses_bulk([("fun", 1.0)])
+        with open(datadog.DATA_FILE) as f:
+            self.assertEqual(json.load(f), {"fun": [float("inf"), 1.0]})
+
+        category = datadog.BudgetManager().categories["fun"]
+        self.assertEqual((category.limit, category.spent), (float("inf"), 1.0))
+        self.assertIn("Total Spent: $1.00", self.run_io(datadog.BudgetManager().show_summary))
+
+
+class CorruptFileCliTest(BudgetTestCase):
+    def test_commands_surface_corrupt_file(self) -> None:
+        with open(datadog.DATA_FILE, "w") as f:
+            f.write('{"a": [1.0')
+        for stdin in ("1\nfood\n10\n5\n", "3\na\n5\n5\n"):
+            with self.subTest(stdin=stdin), self.assertRaises(ValueError):
+                self.run_io(datadog.main, stdin=stdin)
+        with open(datadog.DATA_FILE) as f:
+            self.assertEqual(f.read(), '{"a": [1.0')
+
+    def test_invalid_number_is_still_reported(self) -> None:
+        output = self.run_io(datadog.main, stdin="1\nfood\nlots\n5\n")
+        self.assertIn("⚠️ Please enter a valid number.", output)
+
+
+class ModifiedTest(BudgetTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        with open(datadog.DATA_FILE, "w") as f:
+            json.dump({"food": {"name": "food", "limit": 10.0, "spent": 2.0}}, f)
+        with open(datadog.DATA_FILE, "rb") as f:
+            self.original = f.read()
+
+    def test_read_only_session_does_not_rewrite_file(self) -> None:
+        manager = datadog.BudgetManager()
+        self.run_io(manager.show_summary)
+        manager.save_data()
+        with open(datadog.DATA_FILE, "rb") as f:
+            self.assertEqual(f.read(), self.original)
+
+    def test_zero_expense_is_reported(self) -> None:
+        output = self.run_io(datadog.BudgetManager().add_expense, "food", 0.0)
+        self.assertIn("💸 Added expense of $0.0 to 'food'", output)
+
+    def test_declined_expense_is_not_reported_or_saved(self) -> None:
+        manager = datadog.BudgetManager()
+        output = self.run_io(manager.add_expense, "food", 50.0, stdin="no\n")
+        self.assertIn("🚫 Expense not added.", output)
+        self.assertNotIn("💸", output)
+        manager.save_data()
+        with open(datadog.DATA_FILE, "rb") as f:
+            self.assertEqual(f.read(), self.original)
+
+
+if __name__ == "__main__":
+    unittest.main()